@@ -0,0 +1,43 @@
+"""
+This module provides a helper for running the AWS counter classes concurrently
+using asyncio.
+
+The EC2, security group, and RDS counts are independent I/O waits, so running
+them through asyncio.gather drops total latency from the sum of the three
+calls to roughly the slowest single one.
+
+Usage example:
+    counts = asyncio.run(get_all_counts(region_name='us-west-2'))
+"""
+
+import asyncio
+
+from aws_ec2 import EC2InstanceCounter
+from aws_rds import RDSInstanceCounter
+from aws_sg import EC2SecurityGroupCounter
+
+
+async def get_all_counts(region_name='us-east-1'):
+    """
+    Runs the EC2, security group, and RDS counts concurrently.
+
+    Args:
+        region_name (str): The AWS region to count resources in (default is 'us-east-1').
+
+    Returns:
+        dict: Counts keyed by 'ec2', 'security_groups', and 'rds'; individual
+              values are None if that counter failed.
+    """
+    ec2_count, sg_count, rds_count = await asyncio.gather(
+        EC2InstanceCounter(region_name).get_count_async(),
+        EC2SecurityGroupCounter(region_name).get_count_async(),
+        RDSInstanceCounter(region_name).get_count_async(),
+    )
+    return {'ec2': ec2_count, 'security_groups': sg_count, 'rds': rds_count}
+
+
+# Example usage
+if __name__ == "__main__":
+    counts = asyncio.run(get_all_counts())
+    for service, count in counts.items():
+        print(f"{service}: {count}")
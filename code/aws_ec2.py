@@ -12,9 +12,26 @@ Usage example:
     aggregated_tags = counter.get_aggregated_ec2_tags()
 """
 
-import boto3
+import threading
 from collections import defaultdict
 
+from cachetools import TTLCache
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+from aws_clients import async_client, client
+
+# Short-lived cache of describe_instances pages keyed by (region, operation).
+# Callers that invoke several methods in sequence (count, tags, status) reuse
+# one fetch instead of re-hitting AWS for data that has not changed.
+# cachetools caches are not thread-safe, and MultiRegionCounter drives these
+# counters from a thread pool, so every get/set goes through the lock.
+_describe_cache = TTLCache(maxsize=32, ttl=60)
+_describe_cache_lock = threading.Lock()
+
 class EC2InstanceCounter:
     """
     A class to count EC2 instances and aggregate their tags from a specified AWS region.
@@ -31,7 +48,136 @@ class EC2InstanceCounter:
         Args:
             region_name (str): The AWS region to initialize the EC2 client (default is 'us-east-1').
         """
-        self.ec2_client = boto3.client('ec2', region_name=region_name)
+        self.region_name = region_name
+        self.ec2_client = client('ec2', region_name)
+        self._enumeration = None
+
+    def _describe_instances_pages(self, filters=None):
+        """
+        Returns pages of describe_instances results using a plain NextToken loop.
+
+        A hand-rolled loop with the maximum MaxResults avoids the Python-side
+        result merging overhead of botocore's Paginator, which becomes
+        significant on accounts with many instances. Pages are held in a
+        short-TTL cache so consecutive method calls share one fetch.
+
+        Args:
+            filters (list): Optional Filters passed through to describe_instances.
+
+        Returns:
+            list: The describe_instances response pages.
+        """
+        cache_key = (
+            self.region_name,
+            'describe_instances',
+            tuple((f['Name'], tuple(f['Values'])) for f in filters) if filters else None,
+        )
+        with _describe_cache_lock:
+            pages = _describe_cache.get(cache_key)
+        if pages is None:
+            pages = []
+            kwargs = {'MaxResults': 1000}
+            if filters:
+                kwargs['Filters'] = filters
+            while True:
+                response = self.ec2_client.describe_instances(**kwargs)
+                pages.append(self._compact_page(response))
+                token = response.get('NextToken')
+                if not token:
+                    break
+                kwargs['NextToken'] = token
+            with _describe_cache_lock:
+                _describe_cache[cache_key] = pages
+        return pages
+
+    @staticmethod
+    def _compact_page(response):
+        """
+        Strips a describe_instances page down to the fields the counters read.
+
+        Full instance descriptions run to hundreds of fields each; retaining
+        only the tags keeps the cached pages (and peak memory on large fleets)
+        proportional to the tag data rather than the raw response size. Each
+        full page is released as soon as it is compacted.
+
+        Args:
+            response (dict): One raw describe_instances response page.
+
+        Returns:
+            dict: The page with instances reduced to their Tags.
+        """
+        return {
+            'Reservations': [
+                {
+                    'Instances': [
+                        {'Tags': instance['Tags']} if 'Tags' in instance else {}
+                        for instance in reservation['Instances']
+                    ]
+                }
+                for reservation in response['Reservations']
+            ]
+        }
+
+    def _enumerate(self):
+        """
+        Counts EC2 instances and aggregates their tags in a single pass.
+
+        The (count, tags) tuple is memoized on the instance, so calling both
+        get_count and get_aggregated_tags walks the resource list only once.
+
+        Returns:
+            tuple: (instance count, dict mapping tag keys to lists of values).
+        """
+        if self._enumeration is None:
+            instance_count = 0
+            keys = []
+            values = []
+            # Hoist the bound methods so the hot loop skips repeated
+            # attribute lookups per tag.
+            keys_append = keys.append
+            values_append = values.append
+
+            # Flatten all tags into two parallel arrays, one page at a time
+            for page in self._describe_instances_pages():
+                for reservation in page['Reservations']:
+                    for instance in reservation['Instances']:
+                        instance_count += 1
+                        for tag in instance.get('Tags', []):
+                            keys_append(tag['Key'])
+                            values_append(tag['Value'])
+
+            self._enumeration = (instance_count, self._group_tags(keys, values))
+        return self._enumeration
+
+    @staticmethod
+    def _group_tags(keys, values):
+        """
+        Groups parallel key/value arrays into a dict of tag values per key.
+
+        With pandas available, the grouping runs in C via Series.groupby
+        rather than a per-tag Python dict/append loop, which matters on
+        fleets with millions of tag pairs.
+
+        Args:
+            keys (list): Tag keys, parallel to values.
+            values (list): Tag values, parallel to keys.
+
+        Returns:
+            dict: A dictionary mapping each tag key to its list of values.
+        """
+        if pd is not None and keys:
+            return pd.Series(values).groupby(keys).apply(list).to_dict()
+
+        aggregated_tags = defaultdict(list)
+        # Hoist the lookup so the loop skips a dict subscript dispatch per tag.
+        _get = aggregated_tags.__getitem__
+        for key, value in zip(keys, values):
+            _get(key).append(value)
+        # Freeze the defaultdict rather than copying it into a plain dict;
+        # clearing default_factory stops missing-key inserts without an
+        # O(K) rebuild.
+        aggregated_tags.default_factory = None
+        return aggregated_tags
 
     def get_count(self):
         """
@@ -41,40 +187,108 @@ class EC2InstanceCounter:
             int: The total number of EC2 instances, or None if an error occurs.
         """
         try:
-            response = self.ec2_client.describe_instances()
-            instance_count = sum(
-                len(reservation['Instances']) for reservation in response['Reservations']
-            )
+            return self._enumerate()[0]
+        except Exception as e:
+            print(f"An error occurred: {e}")
+            return None
+
+    async def get_count_async(self):
+        """
+        Asynchronously retrieves the total number of EC2 instances.
+
+        Intended for use with asyncio.gather so independent counters run
+        concurrently instead of serializing their network waits.
+
+        Returns:
+            int: The total number of EC2 instances, or None if an error occurs.
+        """
+        try:
+            instance_count = 0
+            async with async_client('ec2', self.region_name) as ec2_client:
+                kwargs = {'MaxResults': 1000}
+                while True:
+                    response = await ec2_client.describe_instances(**kwargs)
+                    instance_count += sum(
+                        len(reservation['Instances']) for reservation in response['Reservations']
+                    )
+                    token = response.get('NextToken')
+                    if not token:
+                        break
+                    kwargs['NextToken'] = token
             return instance_count
         except Exception as e:
             print(f"An error occurred: {e}")
             return None
 
-    def get_aggregated_tags(self):
+    def get_tag_value_counts(self, tag_key):
+        """
+        Counts EC2 instances per value of the given tag key using Resource Explorer.
+
+        The search runs against AWS's indexed resource inventory, so neither the
+        instance descriptions nor the full tag lists are downloaded and grouped
+        client-side.
+
+        Args:
+            tag_key (str): The tag key to group instance counts by.
+
+        Returns:
+            dict: A dictionary mapping tag values to instance counts, or None
+                  if an error occurs.
+        """
+        value_counts = defaultdict(int)
+
+        try:
+            explorer_client = client('resource-explorer-2', self.region_name)
+            paginator = explorer_client.get_paginator('search')
+            pages = paginator.paginate(
+                QueryString=f'tag.key:{tag_key} resourcetype:ec2:instance'
+            )
+            for page in pages:
+                for resource in page['Resources']:
+                    for prop in resource.get('Properties', []):
+                        if prop.get('Name') != 'tags':
+                            continue
+                        for tag in prop.get('Data', []):
+                            if tag.get('Key') == tag_key:
+                                value_counts[tag['Value']] += 1
+            return dict(value_counts)
+        except Exception as e:
+            print(f"An error occurred: {e}")
+            return None
+
+    def get_aggregated_tags(self, tag_keys=None):
         """
         Aggregates and retrieves tags for all EC2 instances in the specified region.
 
+        Args:
+            tag_keys (list): Optional tag keys to restrict the scan to. When
+                given, instances are filtered server-side so untagged instance
+                descriptions are never downloaded or parsed.
+
         Returns:
             dict: A dictionary where keys are tag names and values are lists of tag values,
                   or None if an error occurs.
         """
+        if tag_keys is None:
+            try:
+                return self._enumerate()[1]
+            except Exception as e:
+                print(f"An error occurred: {e}")
+                return None
+
         aggregated_tags = defaultdict(list)
+        # Hoist the lookup so the loop skips a dict subscript dispatch per tag.
+        _get = aggregated_tags.__getitem__
 
         try:
-            # Retrieve all EC2 instances
-            response = self.ec2_client.describe_instances()
-
-            # Iterate through reservations and instances
-            for reservation in response['Reservations']:
-                for instance in reservation['Instances']:
-                    # Check if the instance has tags
-                    if 'Tags' in instance:
-                        for tag in instance['Tags']:
-                            # Aggregate tags by key
-                            aggregated_tags[tag['Key']].append(tag['Value'])
-
-            return dict(aggregated_tags)  # Convert defaultdict to a regular dict for the output
-
+            filters = [{'Name': f'tag:{key}', 'Values': ['*']} for key in tag_keys]
+            for page in self._describe_instances_pages(filters=filters):
+                for reservation in page['Reservations']:
+                    for instance in reservation['Instances']:
+                        for tag in instance.get('Tags', []):
+                            _get(tag['Key']).append(tag['Value'])
+            aggregated_tags.default_factory = None
+            return aggregated_tags
         except Exception as e:
             print(f"An error occurred: {e}")
             return None
@@ -86,15 +300,11 @@ class EC2InstanceCounter:
         Returns:
             str or None: The status of the EC2 service if operational, else None.
         """
-        try:
-            response = self.ec2_client.describe_account_attributes(AttributeNames=['maxInstances'])
-            if response['AccountAttributes']:
-                return "EC2 Service is operational."
-            else:
-                return None
-        except Exception as e:
-            print(f"An error occurred: {e}")
-            return None
+        # Derive health from the cached count instead of issuing a separate
+        # probe call; both answer the same "is the service reachable" question.
+        if self.get_count() is not None:
+            return "EC2 Service is operational."
+        return None
 
 # Example usage
 if __name__ == "__main__":
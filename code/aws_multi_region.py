@@ -0,0 +1,76 @@
+"""
+This module provides a helper for running any AWS counter class across
+multiple regions concurrently.
+
+Per-region counts are independent I/O waits, so fanning them out over a
+thread pool drops total wall time from the sum of the per-region latencies to
+roughly the slowest single region. Counter construction stays cheap because
+the shared client factory in aws_clients.py caches one client per
+(service, region) pair.
+
+Usage example:
+    multi = MultiRegionCounter(RDSInstanceCounter, ['us-east-1', 'us-west-2'])
+    counts = multi.get_counts()
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+class MultiRegionCounter:
+    """
+    A class to run a single-region counter class across many regions in parallel.
+
+    Attributes:
+        counter_cls (type): The counter class to instantiate per region, e.g.
+            RDSInstanceCounter or EC2InstanceCounter.
+        regions (list): The AWS region names to fan out across.
+    """
+
+    def __init__(self, counter_cls, regions):
+        """
+        Initializes the MultiRegionCounter with a counter class and regions.
+
+        Args:
+            counter_cls (type): A counter class accepting region_name in __init__.
+            regions (list): The AWS region names to count resources in.
+        """
+        self.counter_cls = counter_cls
+        self.regions = list(regions)
+
+    def get_counts(self):
+        """
+        Retrieves resource counts for every region concurrently.
+
+        Returns:
+            dict: A dictionary mapping each region name to its count; individual
+                  values are None if that region's counter failed.
+        """
+        with ThreadPoolExecutor(max_workers=len(self.regions) or 1) as executor:
+            counts = executor.map(
+                lambda region: self.counter_cls(region_name=region).get_count(),
+                self.regions
+            )
+            return dict(zip(self.regions, counts))
+
+    def get_aggregated_tags(self):
+        """
+        Retrieves aggregated tags for every region concurrently.
+
+        Returns:
+            dict: A dictionary mapping each region name to its aggregated tag
+                  dictionary; individual values are None if that region's
+                  counter failed.
+        """
+        with ThreadPoolExecutor(max_workers=len(self.regions) or 1) as executor:
+            tags = executor.map(
+                lambda region: self.counter_cls(region_name=region).get_aggregated_tags(),
+                self.regions
+            )
+            return dict(zip(self.regions, tags))
+
+# Example usage
+if __name__ == "__main__":
+    from aws_rds import RDSInstanceCounter
+
+    multi = MultiRegionCounter(RDSInstanceCounter, ['us-east-1', 'us-west-2'])
+    for region, count in multi.get_counts().items():
+        print(f"{region}: {count}")
@@ -12,8 +12,22 @@ Usage example:
     aggregated_tags = counter.get_aggregated_rds_tags()
 """
 
-import boto3
+import threading
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from cachetools import TTLCache
+
+from aws_clients import async_client, client
+
+# Short-lived cache of describe_db_instances pages keyed by (region,
+# operation). Callers that invoke several methods in sequence (count, tags,
+# status) reuse one fetch instead of re-hitting AWS for data that has not
+# changed.
+# cachetools caches are not thread-safe, and MultiRegionCounter drives these
+# counters from a thread pool, so every get/set goes through the lock.
+_describe_cache = TTLCache(maxsize=32, ttl=60)
+_describe_cache_lock = threading.Lock()
 
 class RDSInstanceCounter:
     """
@@ -22,8 +36,9 @@ class RDSInstanceCounter:
     Attributes:
         region_name (str): The AWS region to connect to. Default is 'us-east-1'.
         rds_client (boto3.client): The Boto3 RDS client instance.
+        tagging_client (boto3.client): The Boto3 Resource Groups Tagging API client instance.
     """
-    
+
     def __init__(self, region_name='us-east-1'):
         """
         Initializes the RDSInstanceCounter with the specified region.
@@ -31,70 +46,245 @@ class RDSInstanceCounter:
         Args:
             region_name (str): The AWS region to initialize the RDS client (default is 'us-east-1').
         """
-        self.rds_client = boto3.client('rds', region_name=region_name)
+        self.region_name = region_name
+        self.rds_client = client('rds', region_name)
+        self.tagging_client = client('resourcegroupstaggingapi', region_name)
+        self._count = None
+        self._tags = None
+
+    def _describe_db_instances_pages(self):
+        """
+        Returns pages of describe_db_instances results using a plain Marker loop.
+
+        A hand-rolled loop with the maximum MaxRecords avoids the Python-side
+        result merging overhead of botocore's Paginator, which becomes
+        significant on accounts with many instances. Pages are held in a
+        short-TTL cache so consecutive method calls share one fetch.
+
+        Returns:
+            list: The describe_db_instances response pages.
+        """
+        cache_key = (self.region_name, 'describe_db_instances')
+        with _describe_cache_lock:
+            pages = _describe_cache.get(cache_key)
+        if pages is None:
+            pages = []
+            kwargs = {'MaxRecords': 100}
+            while True:
+                response = self.rds_client.describe_db_instances(**kwargs)
+                pages.append(response)
+                marker = response.get('Marker')
+                if not marker:
+                    break
+                kwargs['Marker'] = marker
+            with _describe_cache_lock:
+                _describe_cache[cache_key] = pages
+        return pages
 
     def get_count(self):
         """
         Retrieves the total number of RDS instances in the specified region.
 
+        The count is memoized on the instance independently of the tags:
+        counting reads describe_db_instances while tags come from the Resource
+        Groups Tagging API, so a count-only caller never pays for a tag scan.
+
+        Returns:
+            int: The total number of RDS instances, or None if an error occurs.
+        """
+        try:
+            if self._count is None:
+                self._count = sum(
+                    len(page['DBInstances']) for page in self._describe_db_instances_pages()
+                )
+            return self._count
+        except Exception as e:
+            print(f"An error occurred: {e}")
+            return None
+
+    async def get_count_async(self):
+        """
+        Asynchronously retrieves the total number of RDS instances.
+
+        Intended for use with asyncio.gather so independent counters run
+        concurrently instead of serializing their network waits.
+
         Returns:
             int: The total number of RDS instances, or None if an error occurs.
         """
         try:
-            response = self.rds_client.describe_db_instances()
-            rds_instance_count = len(response['DBInstances'])
+            rds_instance_count = 0
+            async with async_client('rds', self.region_name) as rds_client:
+                kwargs = {'MaxRecords': 100}
+                while True:
+                    response = await rds_client.describe_db_instances(**kwargs)
+                    rds_instance_count += len(response['DBInstances'])
+                    marker = response.get('Marker')
+                    if not marker:
+                        break
+                    kwargs['Marker'] = marker
             return rds_instance_count
         except Exception as e:
             print(f"An error occurred: {e}")
             return None
 
+    def get_tag_value_counts(self, tag_key):
+        """
+        Counts RDS instances per value of the given tag key using Resource Explorer.
+
+        The search runs against AWS's indexed resource inventory, so neither the
+        instance descriptions nor the full tag lists are downloaded and grouped
+        client-side.
+
+        Args:
+            tag_key (str): The tag key to group instance counts by.
+
+        Returns:
+            dict: A dictionary mapping tag values to instance counts, or None
+                  if an error occurs.
+        """
+        value_counts = defaultdict(int)
+
+        try:
+            explorer_client = client('resource-explorer-2', self.region_name)
+            paginator = explorer_client.get_paginator('search')
+            pages = paginator.paginate(
+                QueryString=f'tag.key:{tag_key} resourcetype:rds:db'
+            )
+            for page in pages:
+                for resource in page['Resources']:
+                    for prop in resource.get('Properties', []):
+                        if prop.get('Name') != 'tags':
+                            continue
+                        for tag in prop.get('Data', []):
+                            if tag.get('Key') == tag_key:
+                                value_counts[tag['Value']] += 1
+            return dict(value_counts)
+        except Exception as e:
+            print(f"An error occurred: {e}")
+            return None
+
     def get_aggregated_tags(self):
         """
         Aggregates and retrieves tags for all RDS instances in the specified region.
 
+        The result is memoized on the instance independently of the count, and
+        only on success — a failed scan returns None without being cached, so
+        the next call retries.
+
+        Returns:
+            dict: A dictionary where keys are tag names and values are lists of tag values,
+                  or None if an error occurs.
+        """
+        if self._tags is None:
+            self._tags = self._aggregate_tags()
+        return self._tags
+
+    def _aggregate_tags(self):
+        """
+        Aggregates tags for all RDS instances via the Resource Groups Tagging API.
+
         Returns:
             dict: A dictionary where keys are tag names and values are lists of tag values,
                   or None if an error occurs.
         """
         aggregated_tags = defaultdict(list)
+        # Hoist the lookup so the hot loop skips a dict subscript dispatch
+        # per tag.
+        _get = aggregated_tags.__getitem__
 
         try:
-            response = self.rds_client.describe_db_instances()
+            # A single paginated call to the Resource Groups Tagging API returns
+            # ARNs and tags together, avoiding one list_tags_for_resource call
+            # per instance.
+            paginator = self.tagging_client.get_paginator('get_resources')
+            pages = paginator.paginate(
+                ResourceTypeFilters=['rds:db'],
+                PaginationConfig={'PageSize': 100}
+            )
 
-            # Iterate through RDS instances
-            for instance in response['DBInstances']:
-                # Retrieve tags for each RDS instance
-                tags_response = self.rds_client.list_tags_for_resource(
-                    ResourceName=instance['DBInstanceArn']
-                )
-                # Check if the instance has tags
-                if 'TagList' in tags_response:
-                    for tag in tags_response['TagList']:
-                        aggregated_tags[tag['Key']].append(tag['Value'])
+            # Iterate through tagged RDS instances
+            for page in pages:
+                for resource in page['ResourceTagMappingList']:
+                    for tag in resource.get('Tags', []):
+                        _get(tag['Key']).append(tag['Value'])
 
-            return dict(aggregated_tags)  # Convert defaultdict to a regular dict for the output
+            # Freeze the defaultdict rather than copying it into a plain dict;
+            # clearing default_factory stops missing-key inserts without an
+            # O(K) rebuild.
+            aggregated_tags.default_factory = None
+            return aggregated_tags
 
         except Exception as e:
             print(f"An error occurred: {e}")
-            return None
+            return self._get_aggregated_tags_per_instance()
 
-    def get_status(self):
+    def _get_aggregated_tags_per_instance(self):
         """
-        Returns the status of the RDS service or None if it does not apply.
+        Fallback tag aggregation that queries each RDS instance individually.
+
+        Used when the Resource Groups Tagging API is unavailable. The
+        per-instance list_tags_for_resource calls are purely I/O-bound, so
+        they are fanned out over a bounded thread pool; the client connection
+        pool is sized to match, and results are merged in the main thread.
 
         Returns:
-            str or None: The status of the RDS service if operational, else None.
+            dict: A dictionary where keys are tag names and values are lists of tag values,
+                  or None if an error occurs.
         """
+        aggregated_tags = defaultdict(list)
+        # Hoist the lookup so the hot loop skips a dict subscript dispatch
+        # per tag.
+        _get = aggregated_tags.__getitem__
+
         try:
-            response = self.rds_client.describe_orderable_db_instance_options()
-            if response['OrderableDBInstanceOptions']:
-                return "RDS Service is operational."
-            else:
-                return None
+            # Recent describe_db_instances responses carry TagList on each
+            # DBInstance, so a per-instance call is only needed for records
+            # that lack it.
+            pending_arns = []
+            for page in self._describe_db_instances_pages():
+                for instance in page['DBInstances']:
+                    if 'TagList' in instance:
+                        for tag in instance['TagList']:
+                            _get(tag['Key']).append(tag['Value'])
+                    else:
+                        pending_arns.append(instance['DBInstanceArn'])
+
+            if pending_arns:
+                with ThreadPoolExecutor(max_workers=32) as executor:
+                    results = list(executor.map(
+                        lambda arn: self.rds_client.list_tags_for_resource(ResourceName=arn),
+                        pending_arns
+                    ))
+
+                for tags_response in results:
+                    for tag in tags_response.get('TagList', []):
+                        _get(tag['Key']).append(tag['Value'])
+
+            # Freeze the defaultdict rather than copying it into a plain dict;
+            # clearing default_factory stops missing-key inserts without an
+            # O(K) rebuild.
+            aggregated_tags.default_factory = None
+            return aggregated_tags
+
         except Exception as e:
             print(f"An error occurred: {e}")
             return None
 
+    def get_status(self):
+        """
+        Returns the status of the RDS service or None if it does not apply.
+
+        Returns:
+            str or None: The status of the RDS service if operational, else None.
+        """
+        # Derive health from the cached count instead of probing
+        # describe_orderable_db_instance_options, whose paginated response is
+        # enormous and answers the same "is the service reachable" question.
+        if self.get_count() is not None:
+            return "RDS Service is operational."
+        return None
+
 # Example usage
 if __name__ == "__main__":
     counter = RDSInstanceCounter()
@@ -12,9 +12,22 @@ Usage example:
     aggregated_tags = counter.get_aggregated_sg_tags()
 """
 
-import boto3
+import threading
 from collections import defaultdict
 
+from cachetools import TTLCache
+
+from aws_clients import async_client, client
+
+# Short-lived cache of describe_security_groups pages keyed by (region,
+# operation). Callers that invoke several methods in sequence (count, tags,
+# status) reuse one fetch instead of re-hitting AWS for data that has not
+# changed.
+# cachetools caches are not thread-safe, and MultiRegionCounter drives these
+# counters from a thread pool, so every get/set goes through the lock.
+_describe_cache = TTLCache(maxsize=32, ttl=60)
+_describe_cache_lock = threading.Lock()
+
 class EC2SecurityGroupCounter:
     """
     A class to count EC2 security groups and aggregate their tags from a specified AWS region.
@@ -31,7 +44,72 @@ class EC2SecurityGroupCounter:
         Args:
             region_name (str): The AWS region to initialize the EC2 client (default is 'us-east-1').
         """
-        self.ec2_client = boto3.client('ec2', region_name=region_name)
+        self.region_name = region_name
+        self.ec2_client = client('ec2', region_name)
+        self._enumeration = None
+
+    def _describe_security_groups_pages(self):
+        """
+        Returns pages of describe_security_groups results using a plain NextToken loop.
+
+        A hand-rolled loop with the maximum MaxResults avoids the Python-side
+        result merging overhead of botocore's Paginator, which becomes
+        significant on accounts with many security groups. Pages are held in a
+        short-TTL cache so consecutive method calls share one fetch.
+
+        Returns:
+            list: The describe_security_groups response pages.
+        """
+        cache_key = (self.region_name, 'describe_security_groups')
+        with _describe_cache_lock:
+            pages = _describe_cache.get(cache_key)
+        if pages is None:
+            pages = []
+            kwargs = {'MaxResults': 1000}
+            while True:
+                response = self.ec2_client.describe_security_groups(**kwargs)
+                pages.append(response)
+                token = response.get('NextToken')
+                if not token:
+                    break
+                kwargs['NextToken'] = token
+            with _describe_cache_lock:
+                _describe_cache[cache_key] = pages
+        return pages
+
+    def _enumerate(self):
+        """
+        Counts security groups and aggregates their tags in a single pass.
+
+        The (count, tags) tuple is memoized on the instance, so calling both
+        get_count and get_aggregated_tags walks the resource list only once.
+
+        Returns:
+            tuple: (security group count, dict mapping tag keys to lists of values).
+        """
+        if self._enumeration is None:
+            security_group_count = 0
+            aggregated_tags = defaultdict(list)
+            # Hoist the lookup so the hot loop skips a dict subscript dispatch
+            # per tag.
+            _get = aggregated_tags.__getitem__
+
+            # Iterate through security groups, one page at a time
+            for page in self._describe_security_groups_pages():
+                for security_group in page['SecurityGroups']:
+                    security_group_count += 1
+                    # Check if the security group has tags
+                    if 'Tags' in security_group:
+                        for tag in security_group['Tags']:
+                            # Aggregate tags by key
+                            _get(tag['Key']).append(tag['Value'])
+
+            # Freeze the defaultdict rather than copying it into a plain dict;
+            # clearing default_factory stops missing-key inserts without an
+            # O(K) rebuild.
+            aggregated_tags.default_factory = None
+            self._enumeration = (security_group_count, aggregated_tags)
+        return self._enumeration
 
     def get_count(self):
         """
@@ -41,13 +119,73 @@ class EC2SecurityGroupCounter:
             int: The total number of security groups, or None if an error occurs.
         """
         try:
-            response = self.ec2_client.describe_security_groups()
-            security_group_count = len(response['SecurityGroups'])
+            return self._enumerate()[0]
+        except Exception as e:
+            print(f"An error occurred: {e}")
+            return None
+
+    async def get_count_async(self):
+        """
+        Asynchronously retrieves the total number of security groups.
+
+        Intended for use with asyncio.gather so independent counters run
+        concurrently instead of serializing their network waits.
+
+        Returns:
+            int: The total number of security groups, or None if an error occurs.
+        """
+        try:
+            security_group_count = 0
+            async with async_client('ec2', self.region_name) as ec2_client:
+                kwargs = {'MaxResults': 1000}
+                while True:
+                    response = await ec2_client.describe_security_groups(**kwargs)
+                    security_group_count += len(response['SecurityGroups'])
+                    token = response.get('NextToken')
+                    if not token:
+                        break
+                    kwargs['NextToken'] = token
             return security_group_count
         except Exception as e:
             print(f"An error occurred: {e}")
             return None
 
+    def get_tag_value_counts(self, tag_key):
+        """
+        Counts security groups per value of the given tag key using Resource Explorer.
+
+        The search runs against AWS's indexed resource inventory, so neither the
+        group descriptions nor the full tag lists are downloaded and grouped
+        client-side.
+
+        Args:
+            tag_key (str): The tag key to group security group counts by.
+
+        Returns:
+            dict: A dictionary mapping tag values to security group counts, or
+                  None if an error occurs.
+        """
+        value_counts = defaultdict(int)
+
+        try:
+            explorer_client = client('resource-explorer-2', self.region_name)
+            paginator = explorer_client.get_paginator('search')
+            pages = paginator.paginate(
+                QueryString=f'tag.key:{tag_key} resourcetype:ec2:security-group'
+            )
+            for page in pages:
+                for resource in page['Resources']:
+                    for prop in resource.get('Properties', []):
+                        if prop.get('Name') != 'tags':
+                            continue
+                        for tag in prop.get('Data', []):
+                            if tag.get('Key') == tag_key:
+                                value_counts[tag['Value']] += 1
+            return dict(value_counts)
+        except Exception as e:
+            print(f"An error occurred: {e}")
+            return None
+
     def get_aggregated_tags(self):
         """
         Aggregates and retrieves tags for all EC2 security groups in the specified region.
@@ -56,21 +194,8 @@ class EC2SecurityGroupCounter:
             dict: A dictionary where keys are tag names and values are lists of tag values,
                   or None if an error occurs.
         """
-        aggregated_tags = defaultdict(list)
-
         try:
-            response = self.ec2_client.describe_security_groups()
-
-            # Iterate through security groups
-            for security_group in response['SecurityGroups']:
-                # Check if the security group has tags
-                if 'Tags' in security_group:
-                    for tag in security_group['Tags']:
-                        # Aggregate tags by key
-                        aggregated_tags[tag['Key']].append(tag['Value'])
-
-            return dict(aggregated_tags)  # Convert defaultdict to a regular dict for the output
-
+            return self._enumerate()[1]
         except Exception as e:
             print(f"An error occurred: {e}")
             return None
@@ -82,15 +207,11 @@ class EC2SecurityGroupCounter:
         Returns:
             str or None: The status of the Security Groups service if operational, else None.
         """
-        try:
-            response = self.ec2_client.describe_security_groups()
-            if response['SecurityGroups']:
-                return "Security Groups Service is operational."
-            else:
-                return None
-        except Exception as e:
-            print(f"An error occurred: {e}")
-            return None
+        # Derive health from the cached count instead of repeating the full
+        # describe_security_groups call the count already made.
+        if self.get_count() is not None:
+            return "Security Groups Service is operational."
+        return None
 
 # Example usage
 if __name__ == "__main__":
@@ -3,10 +3,26 @@ This module provides a class for counting Azure Network Security Groups (NSGs) a
 in a specified Azure subscription using the Azure SDK for Python (azure-mgmt).
 """
 
+import requests
+from azure.core.pipeline.transport import RequestsTransport
 from azure.identity import DefaultAzureCredential
 from azure.mgmt.network import NetworkManagementClient
+from azure.mgmt.resourcegraph import ResourceGraphClient
+from azure.mgmt.resourcegraph.models import QueryRequest, QueryRequestOptions
 from collections import defaultdict
 
+
+def _build_transport():
+    """
+    Builds a RequestsTransport backed by a session with a larger connection
+    pool, so paginated ARM calls reuse keep-alive connections instead of
+    re-handshaking TLS for each request.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=50, pool_maxsize=50)
+    session.mount('https://', adapter)
+    return RequestsTransport(session=session, session_owner=True)
+
 class AzureNSGCounter:
     """
     A class to count Azure Network Security Groups (NSGs) and aggregate their tags from a specified Azure subscription.
@@ -18,7 +34,62 @@ class AzureNSGCounter:
     
     def __init__(self, subscription_id):
         self.subscription_id = subscription_id
-        self.network_client = NetworkManagementClient(DefaultAzureCredential(), subscription_id)
+        credential = DefaultAzureCredential()
+        self.network_client = NetworkManagementClient(
+            credential, subscription_id, transport=_build_transport()
+        )
+        self.graph_client = ResourceGraphClient(credential)
+        self._enumeration = None
+
+    def _resource_graph_query(self, query):
+        """
+        Runs a KQL query against Azure Resource Graph for this subscription.
+
+        Resource Graph caps a single query at 1000 records, so the helper
+        keeps requesting with the returned skip_token until the result set is
+        complete, accumulating rows across pages.
+
+        Args:
+            query (str): The KQL query text.
+
+        Returns:
+            list: The result rows from all query response pages.
+        """
+        rows = []
+        skip_token = None
+        while True:
+            options = QueryRequestOptions(skip_token=skip_token) if skip_token else None
+            request = QueryRequest(
+                subscriptions=[self.subscription_id], query=query, options=options
+            )
+            response = self.graph_client.resources(request)
+            rows.extend(response.data)
+            skip_token = response.skip_token
+            if not skip_token:
+                break
+        return rows
+
+    def _enumerate(self):
+        """
+        Counts Azure NSGs and aggregates their tags in a single list_all() pass.
+
+        The (count, tags) tuple is memoized on the instance, so calling both
+        get_count and get_aggregated_tags enumerates the subscription only once.
+
+        Returns:
+            tuple: (NSG count, dict mapping tag keys to lists of values).
+        """
+        if self._enumeration is None:
+            nsg_count = 0
+            aggregated_tags = defaultdict(list)
+            for nsg in self.network_client.network_security_groups.list_all():
+                nsg_count += 1
+                if nsg.tags:
+                    for key, value in nsg.tags.items():
+                        aggregated_tags[key].append(value)
+            aggregated_tags.default_factory = None
+            self._enumeration = (nsg_count, aggregated_tags)
+        return self._enumeration
 
     def get_count(self):
         """
@@ -28,10 +99,20 @@ class AzureNSGCounter:
             int: The total number of NSGs, or None if an error occurs.
         """
         try:
-            return sum(1 for _ in self.network_client.network_security_groups.list_all())
+            # A single aggregated Resource Graph query replaces paginating
+            # through every NSG just to count them.
+            data = self._resource_graph_query(
+                "Resources | where type =~ 'microsoft.network/networksecuritygroups' | count"
+            )
+            return data[0]['Count']
         except Exception as e:
             print(f"An error occurred: {e}")
-            return None
+            # Fall back to enumerating through the management SDK.
+            try:
+                return self._enumerate()[0]
+            except Exception as e:
+                print(f"An error occurred: {e}")
+                return None
 
     def get_aggregated_tags(self):
         """
@@ -44,15 +125,25 @@ class AzureNSGCounter:
         aggregated_tags = defaultdict(list)
 
         try:
-            nsgs = self.network_client.network_security_groups.list_all()
-            for nsg in nsgs:
-                if nsg.tags:
-                    for key, value in nsg.tags.items():
+            # Projecting only the tags column keeps the response to a few KB
+            # per page instead of shipping full NSG objects just to read .tags.
+            data = self._resource_graph_query(
+                "Resources | where type =~ 'microsoft.network/networksecuritygroups' | project tags"
+            )
+            for row in data:
+                if row.get('tags'):
+                    for key, value in row['tags'].items():
                         aggregated_tags[key].append(value)
-            return dict(aggregated_tags)
+            aggregated_tags.default_factory = None
+            return aggregated_tags
         except Exception as e:
             print(f"An error occurred: {e}")
-            return None
+            # Fall back to enumerating through the management SDK.
+            try:
+                return self._enumerate()[1]
+            except Exception as e:
+                print(f"An error occurred: {e}")
+                return None
 
     def get_status(self):
         """
@@ -61,15 +152,11 @@ class AzureNSGCounter:
         Returns:
             str or None: The status of the NSG service if operational, else None.
         """
-        try:
-            nsgs = self.network_client.network_security_groups.list_all()
-            if any(True for _ in nsgs):
-                return "Azure NSG Service is operational."
-            else:
-                return None
-        except Exception as e:
-            print(f"An error occurred: {e}")
-            return None
+        # Derive health from the count query instead of re-enumerating every
+        # NSG in the subscription.
+        if self.get_count() is not None:
+            return "Azure NSG Service is operational."
+        return None
 
 # Example usage for AzureNSGCounter
 if __name__ == "__main__":
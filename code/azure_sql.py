@@ -3,10 +3,26 @@ This module provides a class for counting Azure SQL Databases and aggregating th
 in a specified Azure subscription using the Azure SDK for Python (azure-mgmt).
 """
 
+import requests
+from azure.core.pipeline.transport import RequestsTransport
 from azure.identity import DefaultAzureCredential
+from azure.mgmt.resourcegraph import ResourceGraphClient
+from azure.mgmt.resourcegraph.models import QueryRequest, QueryRequestOptions
 from azure.mgmt.sql import SqlManagementClient
 from collections import defaultdict
 
+
+def _build_transport():
+    """
+    Builds a RequestsTransport backed by a session with a larger connection
+    pool, so paginated ARM calls reuse keep-alive connections instead of
+    re-handshaking TLS for each request.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=50, pool_maxsize=50)
+    session.mount('https://', adapter)
+    return RequestsTransport(session=session, session_owner=True)
+
 class AzureSQLDBCounter:
     """
     A class to count Azure SQL Databases and aggregate their tags from a specified Azure subscription.
@@ -18,7 +34,62 @@ class AzureSQLDBCounter:
     
     def __init__(self, subscription_id):
         self.subscription_id = subscription_id
-        self.sql_client = SqlManagementClient(DefaultAzureCredential(), subscription_id)
+        credential = DefaultAzureCredential()
+        self.sql_client = SqlManagementClient(
+            credential, subscription_id, transport=_build_transport()
+        )
+        self.graph_client = ResourceGraphClient(credential)
+        self._enumeration = None
+
+    def _resource_graph_query(self, query):
+        """
+        Runs a KQL query against Azure Resource Graph for this subscription.
+
+        Resource Graph caps a single query at 1000 records, so the helper
+        keeps requesting with the returned skip_token until the result set is
+        complete, accumulating rows across pages.
+
+        Args:
+            query (str): The KQL query text.
+
+        Returns:
+            list: The result rows from all query response pages.
+        """
+        rows = []
+        skip_token = None
+        while True:
+            options = QueryRequestOptions(skip_token=skip_token) if skip_token else None
+            request = QueryRequest(
+                subscriptions=[self.subscription_id], query=query, options=options
+            )
+            response = self.graph_client.resources(request)
+            rows.extend(response.data)
+            skip_token = response.skip_token
+            if not skip_token:
+                break
+        return rows
+
+    def _enumerate(self):
+        """
+        Counts Azure SQL Databases and aggregates their tags in a single pass.
+
+        The (count, tags) tuple is memoized on the instance, so calling both
+        get_count and get_aggregated_tags enumerates the subscription only once.
+
+        Returns:
+            tuple: (SQL Database count, dict mapping tag keys to lists of values).
+        """
+        if self._enumeration is None:
+            db_count = 0
+            aggregated_tags = defaultdict(list)
+            for db in self.sql_client.databases.list():
+                db_count += 1
+                if db.tags:
+                    for key, value in db.tags.items():
+                        aggregated_tags[key].append(value)
+            aggregated_tags.default_factory = None
+            self._enumeration = (db_count, aggregated_tags)
+        return self._enumeration
 
     def get_count(self):
         """
@@ -28,11 +99,20 @@ class AzureSQLDBCounter:
             int: The total number of SQL Databases, or None if an error occurs.
         """
         try:
-            sql_dbs = self.sql_client.databases.list()
-            return sum(1 for _ in sql_dbs)
+            # A single aggregated Resource Graph query replaces paginating
+            # through every database just to count them.
+            data = self._resource_graph_query(
+                "Resources | where type =~ 'microsoft.sql/servers/databases' | count"
+            )
+            return data[0]['Count']
         except Exception as e:
             print(f"An error occurred: {e}")
-            return None
+            # Fall back to enumerating through the management SDK.
+            try:
+                return self._enumerate()[0]
+            except Exception as e:
+                print(f"An error occurred: {e}")
+                return None
 
     def get_aggregated_tags(self):
         """
@@ -45,15 +125,26 @@ class AzureSQLDBCounter:
         aggregated_tags = defaultdict(list)
 
         try:
-            sql_dbs = self.sql_client.databases.list()
-            for db in sql_dbs:
-                if db.tags:
-                    for key, value in db.tags.items():
+            # Projecting only the tags column keeps the response to a few KB
+            # per page instead of shipping full database objects just to read
+            # .tags.
+            data = self._resource_graph_query(
+                "Resources | where type =~ 'microsoft.sql/servers/databases' | project tags"
+            )
+            for row in data:
+                if row.get('tags'):
+                    for key, value in row['tags'].items():
                         aggregated_tags[key].append(value)
-            return dict(aggregated_tags)
+            aggregated_tags.default_factory = None
+            return aggregated_tags
         except Exception as e:
             print(f"An error occurred: {e}")
-            return None
+            # Fall back to enumerating through the management SDK.
+            try:
+                return self._enumerate()[1]
+            except Exception as e:
+                print(f"An error occurred: {e}")
+                return None
 
     def get_status(self):
         """
@@ -62,15 +153,11 @@ class AzureSQLDBCounter:
         Returns:
             str or None: The status of the SQL Database service if operational, else None.
         """
-        try:
-            sql_dbs = self.sql_client.databases.list()
-            if any(True for _ in sql_dbs):
-                return "Azure SQL Database Service is operational."
-            else:
-                return None
-        except Exception as e:
-            print(f"An error occurred: {e}")
-            return None
+        # Derive health from the count query instead of re-enumerating every
+        # database in the subscription.
+        if self.get_count() is not None:
+            return "Azure SQL Database Service is operational."
+        return None
 
 # Example usage for AzureSQLDBCounter
 if __name__ == "__main__":
@@ -3,9 +3,27 @@ This module provides a class for counting Azure Virtual Machines (VMs) and aggre
 in a specified Azure subscription using the Azure SDK for Python (azure-mgmt).
 """
 
+import requests
+from azure.core.pipeline.transport import RequestsTransport
 from azure.identity import DefaultAzureCredential
 from azure.mgmt.compute import ComputeManagementClient
+from azure.mgmt.resource import ResourceManagementClient
+from azure.mgmt.resourcegraph import ResourceGraphClient
+from azure.mgmt.resourcegraph.models import QueryRequest, QueryRequestOptions
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _build_transport():
+    """
+    Builds a RequestsTransport backed by a session with a larger connection
+    pool, so paginated ARM calls reuse keep-alive connections instead of
+    re-handshaking TLS for each request.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=50, pool_maxsize=50)
+    session.mount('https://', adapter)
+    return RequestsTransport(session=session, session_owner=True)
 
 class AzureVMCounter:
     """
@@ -18,7 +36,78 @@ class AzureVMCounter:
     
     def __init__(self, subscription_id):
         self.subscription_id = subscription_id
-        self.compute_client = ComputeManagementClient(DefaultAzureCredential(), subscription_id)
+        credential = DefaultAzureCredential()
+        self.compute_client = ComputeManagementClient(
+            credential, subscription_id, transport=_build_transport()
+        )
+        self.graph_client = ResourceGraphClient(credential)
+        self.resource_client = ResourceManagementClient(
+            credential, subscription_id, transport=_build_transport()
+        )
+        self._enumeration = None
+
+    def _resource_graph_query(self, query):
+        """
+        Runs a KQL query against Azure Resource Graph for this subscription.
+
+        Resource Graph caps a single query at 1000 records, so the helper
+        keeps requesting with the returned skip_token until the result set is
+        complete, accumulating rows across pages.
+
+        Args:
+            query (str): The KQL query text.
+
+        Returns:
+            list: The result rows from all query response pages.
+        """
+        rows = []
+        skip_token = None
+        while True:
+            options = QueryRequestOptions(skip_token=skip_token) if skip_token else None
+            request = QueryRequest(
+                subscriptions=[self.subscription_id], query=query, options=options
+            )
+            response = self.graph_client.resources(request)
+            rows.extend(response.data)
+            skip_token = response.skip_token
+            if not skip_token:
+                break
+        return rows
+
+    def _enumerate(self):
+        """
+        Counts Azure VMs and aggregates their tags in one concurrent scan.
+
+        Instead of the single serially-paginated list_all() endpoint, the
+        subscription's resource groups are listed first and one
+        virtual_machines.list() call per group is fanned out over a thread
+        pool, so total latency tracks the slowest group rather than the sum.
+        The (count, tags) tuple is memoized on the instance, so calling both
+        get_count and get_aggregated_tags enumerates the subscription only once.
+
+        Returns:
+            tuple: (VM count, dict mapping tag keys to lists of values).
+        """
+        if self._enumeration is None:
+            vm_count = 0
+            aggregated_tags = defaultdict(list)
+
+            groups = list(self.resource_client.resource_groups.list())
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                vm_lists = executor.map(
+                    lambda group: list(self.compute_client.virtual_machines.list(group.name)),
+                    groups
+                )
+                for vms in vm_lists:
+                    for vm in vms:
+                        vm_count += 1
+                        if vm.tags:
+                            for key, value in vm.tags.items():
+                                aggregated_tags[key].append(value)
+
+            aggregated_tags.default_factory = None
+            self._enumeration = (vm_count, aggregated_tags)
+        return self._enumeration
 
     def get_count(self):
         """
@@ -28,11 +117,20 @@ class AzureVMCounter:
             int: The total number of VMs, or None if an error occurs.
         """
         try:
-            vms = self.compute_client.virtual_machines.list_all()
-            return sum(1 for _ in vms)
+            # A single aggregated Resource Graph query replaces paginating
+            # through every VM just to count them.
+            data = self._resource_graph_query(
+                "Resources | where type =~ 'microsoft.compute/virtualmachines' | count"
+            )
+            return data[0]['Count']
         except Exception as e:
             print(f"An error occurred: {e}")
-            return None
+            # Fall back to enumerating through the management SDK.
+            try:
+                return self._enumerate()[0]
+            except Exception as e:
+                print(f"An error occurred: {e}")
+                return None
 
     def get_aggregated_tags(self):
         """
@@ -45,15 +143,25 @@ class AzureVMCounter:
         aggregated_tags = defaultdict(list)
 
         try:
-            vms = self.compute_client.virtual_machines.list_all()
-            for vm in vms:
-                if vm.tags:
-                    for key, value in vm.tags.items():
+            # Projecting only the tags column keeps the response to a few KB
+            # per page instead of shipping full VM objects just to read .tags.
+            data = self._resource_graph_query(
+                "Resources | where type =~ 'microsoft.compute/virtualmachines' | project tags"
+            )
+            for row in data:
+                if row.get('tags'):
+                    for key, value in row['tags'].items():
                         aggregated_tags[key].append(value)
-            return dict(aggregated_tags)
+            aggregated_tags.default_factory = None
+            return aggregated_tags
         except Exception as e:
             print(f"An error occurred: {e}")
-            return None
+            # Fall back to enumerating through the management SDK.
+            try:
+                return self._enumerate()[1]
+            except Exception as e:
+                print(f"An error occurred: {e}")
+                return None
 
     def get_status(self):
         """
@@ -62,15 +170,11 @@ class AzureVMCounter:
         Returns:
             str or None: The status of the VM service if operational, else None.
         """
-        try:
-            vms = self.compute_client.virtual_machines.list_all()
-            if any(True for _ in vms):
-                return "Azure VM Service is operational."
-            else:
-                return None
-        except Exception as e:
-            print(f"An error occurred: {e}")
-            return None
+        # Derive health from the count query instead of re-enumerating every
+        # VM in the subscription.
+        if self.get_count() is not None:
+            return "Azure VM Service is operational."
+        return None
 
 # Example usage for AzureVMCounter
 if __name__ == "__main__":